@@ -0,0 +1,27 @@
+"""Cached key-derivation helpers.
+
+Mnemonic and address derivation are pure functions of their input but run
+non-trivial hashing on every call, so the results are memoized.
+"""
+
+import functools
+
+from algosdk import account, mnemonic
+
+
+@functools.lru_cache(maxsize=None)
+def to_private_key(passphrase):
+    """Return the private key for a mnemonic, cached per passphrase."""
+    return mnemonic.to_private_key(passphrase)
+
+
+@functools.lru_cache(maxsize=None)
+def to_public_key(passphrase):
+    """Return the address for a mnemonic, cached per passphrase."""
+    return mnemonic.to_public_key(passphrase)
+
+
+@functools.lru_cache(maxsize=None)
+def address_from_private_key(private_key):
+    """Return the address for a private key, cached per key."""
+    return account.address_from_private_key(private_key)
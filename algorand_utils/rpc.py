@@ -0,0 +1,56 @@
+"""Shared RPC helpers for the example contracts and their tests."""
+
+import time
+
+
+def wait_for_confirmation(
+    client, transaction_id, timeout=5, *, initial_interval=0.05, max_interval=3.5
+):
+    """
+    Wait until the transaction is confirmed or rejected, or until 'timeout'
+    seconds have passed.
+
+    Polls `pending_transaction_info` with an exponentially backed off sleep
+    interval instead of blocking on `status_after_block` every round, so fast
+    sandbox transactions confirm in a single round-trip.
+    Args:
+        transaction_id (str): the transaction to wait for
+        timeout (int): maximum number of seconds to wait
+        initial_interval (float): initial polling interval in seconds
+        max_interval (float): upper bound for the backoff interval in seconds
+    Returns:
+        dict: pending transaction information, or throws an error if the transaction
+            is not confirmed or rejected within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    not_found = 0
+
+    while time.monotonic() < deadline:
+        try:
+            pending_txn = client.pending_transaction_info(transaction_id)
+        except Exception:
+            not_found += 1
+            if not_found > 6:
+                raise Exception(
+                    "pending tx {} is unknown to the node".format(transaction_id)
+                )
+            if not_found > 5:
+                # Still unknown after repeated polls; give it one full round
+                # to propagate before the final attempt.
+                client.status_after_block(client.status()["last-round"])
+            else:
+                time.sleep(interval)
+                interval = min(interval * 1.5, max_interval)
+            continue
+        if pending_txn.get("confirmed-round", 0) > 0:
+            return pending_txn
+        elif pending_txn["pool-error"]:
+            raise Exception("pool error: {}".format(pending_txn["pool-error"]))
+        time.sleep(interval)
+        interval = min(interval * 1.5, max_interval)
+    raise Exception(
+        "pending tx not confirmed in timeout seconds, timeout value = : {}".format(
+            timeout
+        )
+    )
@@ -1,36 +1,27 @@
 import base64
+import functools
 
 from algosdk.future import transaction
-from algosdk import mnemonic
 from algosdk.v2client import algod
 from pyteal import *
 
+from algorand_utils.crypto import to_private_key, to_public_key
+from algorand_utils.rpc import wait_for_confirmation
+
 sender_mnemonic = "SENDER MNEMONIC"
 receiver_public_key = "UFAGBH5BHBAKDSSSBKP6LAZ7VFIA3ETNK7LVNEH6KXRRNTYE6WYHTEMEGU"
 algod_address = "http://localhost:4001"
 algod_token = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
 
-def compile_smart_signature(client, source_code):
-    compile_response = client.compile(source_code)
-    return compile_response['result'], compile_response['hash']
-
-def wait_for_confirmation(client, transaction_id, timeout):
-    start_round = client.status()["last-round"] + 1
-    current_round = start_round
+_compile_cache = {}
 
-    while current_round < start_round + timeout:
-        try:
-            pending_txn = client.pending_transaction_info(transaction_id)
-        except Exception:
-            return
-        if pending_txn.get("confirmed-round", 0) > 0:
-            return pending_txn
-        elif pending_txn["pool-error"]:
-            raise Exception('pool error: {}'.format(pending_txn["pool-error"]))
-        client.status_after_block(current_round)
-        current_round += 1
-    raise Exception('pending tx not found in timeout rounds, timeout value = {}'.format(timeout))
+def compile_smart_signature(client, source_code):
+    if source_code not in _compile_cache:
+        compile_response = client.compile(source_code)
+        _compile_cache[source_code] = (compile_response['result'], compile_response['hash'])
+    return _compile_cache[source_code]
 
+@functools.lru_cache(maxsize=None)
 def donation_escrow(benefactor):
     program = And(
         Txn.type_enum() == TxnType.Payment,
@@ -41,8 +32,8 @@ def donation_escrow(benefactor):
 
 def payment_transaction(creator_mnemonic, amt, rcv, algod_client):
     params = algod_client.suggested_params()
-    add = mnemonic.to_public_key(creator_mnemonic)
-    key = mnemonic.to_private_key(creator_mnemonic)
+    add = to_public_key(creator_mnemonic)
+    key = to_private_key(creator_mnemonic)
     unsigned_txn = transaction.PaymentTxn(add, params, rcv, amt)
     signed = unsigned_txn.sign(key)
     txid = algod_client.send_transaction(signed)
@@ -52,8 +43,7 @@ def payment_transaction(creator_mnemonic, amt, rcv, algod_client):
 def lsig_payment_txn(escrowProg, escrow_address, amt, rcv, algod_client):
     params = algod_client.suggested_params()
     unsigned_txn = transaction.PaymentTxn(escrow_address, params, rcv, amt)
-    encodedProg = escrowProg.encode()
-    program = base64.decodebytes(encodedProg)
+    program = base64.b64decode(escrowProg)
     lsig = transaction.LogicSig(program)
     stxn = transaction.LogicSigTransaction(unsigned_txn, lsig)
     tx_id = algod_client.send_transaction(stxn)
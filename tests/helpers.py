@@ -1,14 +1,25 @@
 """Module containing helper functions for accessing Algorand blockchain."""
 
 import base64
+import functools
+import hashlib
+import io
+import json
 import os
 import pty
 import subprocess
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from algosdk import account, mnemonic
+import requests
+from algosdk import account, constants
 from algosdk.future import transaction
 from algosdk.v2client import algod, indexer
+from requests import adapters
+
+from algorand_utils.crypto import to_private_key
+from algorand_utils.rpc import wait_for_confirmation as _wait_for_confirmation
 
 INDEXER_TIMEOUT = 10  # 61 for devMode
 
@@ -52,55 +63,70 @@ def _sandbox_executable():
 
 def call_sandbox_command(*args):
     """Call and return sandbox command composed from provided arguments."""
-    return subprocess.run(
-        [_sandbox_executable(), *args], stdin=pty.openpty()[1], capture_output=True
-    )
+    # goal refuses to run without a terminal-like stdin, so hand it a pty,
+    # but close both ends afterwards instead of leaking them per call.
+    master, slave = pty.openpty()
+    try:
+        return subprocess.run(
+            [_sandbox_executable(), *args], stdin=slave, capture_output=True
+        )
+    finally:
+        os.close(master)
+        os.close(slave)
 
 
 ## CLIENTS
+_http_session = requests.Session()
+_http_session.mount(
+    "http://", adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+)
+
+
+def _session_urlopen(req):
+    """Drop-in replacement for urllib.request.urlopen backed by a shared session.
+
+    The algod and indexer clients open a fresh TCP connection per request
+    through urlopen; routing them through one pooled session keeps connections
+    alive across the many helper calls a single test makes.
+    """
+    resp = _http_session.request(
+        req.get_method(), req.full_url, headers=dict(req.header_items()), data=req.data
+    )
+    if resp.status_code >= 400:
+        raise urllib.error.HTTPError(
+            req.full_url,
+            resp.status_code,
+            resp.reason,
+            resp.headers,
+            io.BytesIO(resp.content),
+        )
+    return io.BytesIO(resp.content)
+
+
+algod.urlopen = _session_urlopen
+indexer.urlopen = _session_urlopen
+
+
+@functools.lru_cache(maxsize=1)
 def _algod_client():
-    """Instantiate and return Algod client object."""
+    """Return the shared Algod client object."""
     algod_address = "http://localhost:4001"
     algod_token = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
     return algod.AlgodClient(algod_token, algod_address)
 
 
+@functools.lru_cache(maxsize=1)
 def _indexer_client():
-    """Instantiate and return Indexer client object."""
+    """Return the shared Indexer client object."""
     indexer_address = "http://localhost:8980"
     indexer_token = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
     return indexer.IndexerClient(indexer_token, indexer_address)
 
 
 ## TRANSACTIONS
-def _wait_for_confirmation(client, transaction_id, timeout=5):
-    """
-    Wait until the transaction is confirmed or rejected, or until 'timeout'
-    number of rounds have passed.
-    Args:
-        transaction_id (str): the transaction to wait for
-        timeout (int): maximum number of rounds to wait
-    Returns:
-        dict: pending transaction information, or throws an error if the transaction
-            is not confirmed or rejected in the next timeout rounds
-    """
-    start_round = client.status()["last-round"] + 1
-    current_round = start_round
-
-    while current_round < start_round + timeout:
-        try:
-            pending_txn = client.pending_transaction_info(transaction_id)
-        except Exception:
-            return
-        if pending_txn.get("confirmed-round", 0) > 0:
-            return pending_txn
-        elif pending_txn["pool-error"]:
-            raise Exception("pool error: {}".format(pending_txn["pool-error"]))
-        client.status_after_block(current_round)
-        current_round += 1
-    raise Exception(
-        "pending tx not found in timeout rounds, timeout value = : {}".format(timeout)
-    )
+# Reused across all helpers so ed25519 signing overlaps with the Python-side
+# serialization and submission work instead of running on the calling thread.
+_SIGN_POOL = ThreadPoolExecutor(max_workers=4)
 
 
 def suggested_params():
@@ -108,28 +134,38 @@ def suggested_params():
     return _algod_client().suggested_params()
 
 
-def send_transactions(sender, txns):
+def _sign_and_send(private_keys, txns):
     """
-    Send transaction to network and wait for confirmation.
-    Args:
-        sender: dict{str, str} - private key, account address
-        txn: transaction
+    Sign each transaction with its matching key, submit, and wait for
+    confirmation. Single transactions skip grouping entirely; multiple
+    transactions are submitted as one atomic group.
     """
-    if len(txns) == 0:
-        return
-
     client = _algod_client()
     if len(txns) == 1:
-        signed_txn = txns[0].sign(sender.get("private_key"))
+        signed_txn = txns[0].sign(private_keys[0])
         client.send_transaction(signed_txn)
         return _wait_for_confirmation(client, signed_txn.get_txid())
 
     transaction.assign_group_id(txns)
-    signed_txns = [txn.sign(sender.get("private_key")) for txn in txns]
+    signed_txns = list(
+        _SIGN_POOL.map(lambda txn, key: txn.sign(key), txns, private_keys)
+    )
     transaction_id = client.send_transactions(signed_txns)
     return _wait_for_confirmation(client, transaction_id)
 
 
+def send_transactions(sender, txns):
+    """
+    Send transaction to network and wait for confirmation.
+    Args:
+        sender: dict{str, str} - private key, account address
+        txn: transaction
+    """
+    if len(txns) == 0:
+        return
+    return _sign_and_send([sender.get("private_key")] * len(txns), txns)
+
+
 def fund_accounts(addresses, funds):
     """Fund provided `addresses` with `funds` amount of microAlgos."""
     funder = _initial_funds_address()
@@ -140,54 +176,31 @@ def fund_accounts(addresses, funds):
     if len(funds) != num_addr or num_addr == 0:
         raise Exception("number of addresses and intial funds are not the same")
 
-    client = _algod_client()
-    params = client.suggested_params()
-    funder_private_key = mnemonic.to_private_key(_cli_passphrase_for_account(funder))
-
-    if num_addr == 1:
-        txn = transaction.PaymentTxn(
-            funder, params, addresses[0].get("address"), funds[0]
-        )
-        signed_txn = txn.sign(funder_private_key)
-        transaction_id = client.send_transaction(signed_txn)
-        _wait_for_confirmation(client, transaction_id)
-        return
+    params = _algod_client().suggested_params()
+    funder_private_key = to_private_key(_cli_passphrase_for_account(funder))
 
     txns = [
         transaction.PaymentTxn(funder, params, addresses[i].get("address"), funds[i])
         for i in range(num_addr)
     ]
-    transaction.assign_group_id(txns)
-    signed_txns = [txn.sign(funder_private_key) for txn in txns]
-    transaction_id = client.send_transactions(signed_txns)
-    _wait_for_confirmation(client, transaction_id)
+    # algod only accepts multi-transaction payloads as atomic groups, so
+    # batches past the group cap are split into group-sized chunks, each
+    # submitted and confirmed as its own group.
+    for start in range(0, num_addr, constants.tx_group_limit):
+        chunk = txns[start : start + constants.tx_group_limit]
+        _sign_and_send([funder_private_key] * len(chunk), chunk)
 
 
 def opt_in_app(accounts, app_id):
     if len(accounts) == 0:
         return
 
-    client = _algod_client()
-    params = client.suggested_params()
-    if len(accounts) == 1:
-        txn = transaction.ApplicationOptInTxn(
-            accounts[0].get("address"), params, app_id
-        )
-        signed_txn = txn.sign(accounts[0].get("private_key"))
-        transaction_id = client.send_transaction(signed_txn)
-        _wait_for_confirmation(client, transaction_id)
-        return
-
+    params = _algod_client().suggested_params()
     txns = [
         transaction.ApplicationOptInTxn(a.get("address"), params, app_id)
         for a in accounts
     ]
-    transaction.assign_group_id(txns)
-    signed_txns = [
-        txns[i].sign(accounts[i].get("private_key")) for i in range(len(accounts))
-    ]
-    transaction_id = client.send_transactions(signed_txns)
-    _wait_for_confirmation(client, transaction_id)
+    _sign_and_send([a.get("private_key") for a in accounts], txns)
 
 
 ## CREATING
@@ -198,16 +211,22 @@ def add_standalone_account():
 
 
 ## RETRIEVING
+@functools.lru_cache(maxsize=1)
 def _initial_funds_address():
     """Get the address of initially created account having enough funds.
 
     Such an account is used to transfer initial funds for the accounts
-    created in this tutorial.
+    created in this tutorial. The indexer query filters on a large minimum
+    balance so only the sandbox genesis accounts come back instead of every
+    account the node has ever seen, and the result is cached since the
+    funder cannot change within a test run.
     """
     return next(
         (
             account.get("address")
-            for account in _indexer_client().accounts().get("accounts", [{}, {}])
+            for account in _indexer_client()
+            .accounts(min_balance=1_000_000_000_000)
+            .get("accounts", [{}, {}])
             if account.get("created-at-round") == 0
             and account.get("status") == "Offline"  # "Online" for devMode
         ),
@@ -215,30 +234,53 @@ def _initial_funds_address():
     )
 
 
+def _decode_state_value(value):
+    """Decode a single global-state value according to its type tag."""
+    value_type = value["type"]
+    if value_type == 1:  # value is byte array
+        return base64.b64decode(value.get("bytes", ""))
+    if value_type == 2:  # value is uint64
+        return value.get("uint", 0)
+    raise Exception(f"Unexpected state type: {value_type}")
+
+
 def get_app_global_state(app_id):
-    client = _algod_client()
-    app_info = client.application_info(app_id)
+    app_info = _algod_client().application_info(app_id)
+    b64decode = base64.b64decode
+    return {
+        b64decode(pair["key"]): _decode_state_value(pair["value"])
+        for pair in app_info["params"]["global-state"]
+    }
+
 
-    state = {}
-    for pair in app_info["params"]["global-state"]:
-        key = base64.b64decode(pair["key"])
-        value = pair["value"]
-        value_type = value["type"]
+## PYTEAL
+TEAL_CACHE_FILE = Path(__file__).resolve().parent / ".teal_cache" / "compiled.json"
 
-        if value_type == 1:  # value is byte array
-            value = base64.b64decode(value.get("bytes", ""))
-        elif value_type == 2:  # value is uint64
-            value = value.get("uint", 0)
-        else:
-            raise Exception(f"Unexpected state type: {value_type}")
 
-        state[key] = value
+def _load_teal_cache():
+    """Return the on-disk TEAL bytecode cache, or an empty one if unreadable."""
+    try:
+        return json.loads(TEAL_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
 
-    return state
 
+_teal_cache = _load_teal_cache()
 
-## PYTEAL
+
+@functools.lru_cache(maxsize=None)
 def compile_teal_source(teal_source):
-    """Compile teal and return teal binary code."""
-    compile_response = _algod_client().compile(teal_source)
-    return base64.b64decode(compile_response["result"])
+    """Compile teal and return teal binary code.
+
+    Compilation of a fixed teal source is deterministic, so compiled bytecode
+    is cached in memory and persisted on disk keyed by the source hash to
+    avoid repeat `algod` compile round-trips across test runs.
+    """
+    key = hashlib.sha256(teal_source.encode("utf8")).hexdigest()
+    result = _teal_cache.get(key)
+    if result is None:
+        result = _algod_client().compile(teal_source)["result"]
+        _teal_cache[key] = result
+        TEAL_CACHE_FILE.parent.mkdir(exist_ok=True)
+        TEAL_CACHE_FILE.write_text(json.dumps(_teal_cache))
+    return base64.b64decode(result)
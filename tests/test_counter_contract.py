@@ -1,3 +1,6 @@
+import logging
+import os
+
 import pytest
 
 from algosdk.future import transaction
@@ -15,6 +18,8 @@ from helpers import (
 
 from counter_contract import approval_program, clear_state_program
 
+logger = logging.getLogger(__name__)
+
 
 def setup_module(module):
     """Ensure Algorand Sandbox is up prior to running tests from this module."""
@@ -28,22 +33,38 @@ class TestCounterContract:
         self.deployer = add_standalone_account()
         self.users = [add_standalone_account() for i in range(2)]
 
-        print()
-        print("init fund for deployer, users")
+        self.approval_compiled = compile_teal_source(approval_program())
+        self.clear_compiled = compile_teal_source(clear_state_program())
+        self.global_schema = transaction.StateSchema(num_uints=1, num_byte_slices=0)
+        self.local_schema = transaction.StateSchema(num_uints=0, num_byte_slices=0)
+
+        logger.debug("init fund for deployer, users")
         fund_accounts(
             [self.deployer] + self.users,
             [5_000_000] * (1 + len(self.users)),
         )
 
+    def _params(self):
+        """Return cached suggested params, refreshed after 100 uses.
+
+        Suggested params stay valid for ~1000 rounds, so one fetch covers
+        every transaction a test method builds.
+        """
+        if getattr(self, "_sp", None) is None or self._sp_age > 100:
+            self._sp = suggested_params()
+            self._sp_age = 0
+        self._sp_age += 1
+        return self._sp
+
     def _create(self):
         txn = transaction.ApplicationCreateTxn(
             sender=self.deployer.get("address"),
             on_complete=transaction.OnComplete.NoOpOC,
-            approval_program=compile_teal_source(approval_program()),
-            clear_program=compile_teal_source(clear_state_program()),
-            global_schema=transaction.StateSchema(num_uints=1, num_byte_slices=0),
-            local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
-            sp=suggested_params(),
+            approval_program=self.approval_compiled,
+            clear_program=self.clear_compiled,
+            global_schema=self.global_schema,
+            local_schema=self.local_schema,
+            sp=self._params(),
         )
         return send_transactions(self.deployer, [txn]).get("application-index")
 
@@ -54,49 +75,52 @@ class TestCounterContract:
         self._noop_call(sender, app_id, b"Deduct")
 
     def _noop_call(self, sender, app_id, method):
+        # A random note keeps repeated identical calls unique: with cached
+        # params the txid would otherwise repeat and be rejected as a replay.
         txn = transaction.ApplicationCallTxn(
             sender=sender.get("address"),
             index=app_id,
             on_complete=transaction.OnComplete.NoOpOC,
             app_args=[method],
             accounts=[sender.get("address")],
-            sp=suggested_params(),
+            sp=self._params(),
+            note=os.urandom(8),
         )
         send_transactions(sender, [txn])
 
     def test_add_deduct(self):
-        print("deployer creates app")
+        logger.debug("deployer creates app")
         app_id = self._create()
 
-        print("user adds")
+        logger.debug("user adds")
         self._add(self.users[0], app_id)
 
-        print("user adds")
+        logger.debug("user adds")
         self._add(self.users[1], app_id)
 
-        print("user adds")
+        logger.debug("user adds")
         self._add(self.users[0], app_id)
         app_global_state = get_app_global_state(app_id)
         assert app_global_state[b"Count"] == 3
 
-        print("user deducts")
+        logger.debug("user deducts")
         self._deduct(self.users[1], app_id)
 
-        print("user deducts")
+        logger.debug("user deducts")
         self._deduct(self.users[1], app_id)
         app_global_state = get_app_global_state(app_id)
         assert app_global_state[b"Count"] == 1
 
     def test_deduct_below_zero(self):
-        print("deployer creates app")
+        logger.debug("deployer creates app")
         app_id = self._create()
 
-        print("user deducts counter to below zero but cannot")
+        logger.debug("user deducts counter to below zero but cannot")
         self._deduct(self.users[0], app_id)
         app_global_state = get_app_global_state(app_id)
         assert app_global_state[b"Count"] == 0
 
-        print("users add then try to deduct more than add")
+        logger.debug("users add then try to deduct more than add")
         self._add(self.users[1], app_id)
         self._deduct(self.users[0], app_id)
         self._deduct(self.users[1], app_id)
@@ -104,21 +128,21 @@ class TestCounterContract:
         assert app_global_state[b"Count"] == 0
 
     def test_two_adds(self):
-        print("deployer creates app")
+        logger.debug("deployer creates app")
         app_id = self._create()
 
-        print("users opt in to app but cannot, app does not hold local state")
+        logger.debug("users opt in to app but cannot, app does not hold local state")
         with pytest.raises(Exception):
             opt_in_app(self.users, app_id)
 
-        print("user tries to add 2 times in a transaction group")
+        logger.debug("user tries to add 2 times in a transaction group")
         txn_1 = transaction.ApplicationCallTxn(
             sender=self.users[0].get("address"),
             index=app_id,
             on_complete=transaction.OnComplete.NoOpOC,
             app_args=[b"add"],
             accounts=[self.users[0].get("address")],
-            sp=suggested_params(),
+            sp=self._params(),
             note="first",
         )
         txn_2 = transaction.ApplicationCallTxn(
@@ -127,7 +151,7 @@ class TestCounterContract:
             on_complete=transaction.OnComplete.NoOpOC,
             app_args=[b"add"],
             accounts=[self.users[0].get("address")],
-            sp=suggested_params(),
+            sp=self._params(),
             note="second",
         )
         with pytest.raises(Exception):